@@ -1,2 +1,2 @@
 from .backend_interface import BackendInterface
-from .util import IOA, COA
\ No newline at end of file
+from .util import IOA, COA, PrimitiveDatapoint
\ No newline at end of file
@@ -1,9 +1,12 @@
 import abc
-from typing import Union, Tuple, Any, Iterable, Set, Optional, Callable
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Union, Tuple, Any, Iterable, FrozenSet, Optional, Callable, Dict, List, \
+    DefaultDict, Set, Mapping
 from threading import Event
 
 from .util import COA, IOA, control_direction_processinfo_type_ids, type_id_to_permitted_IOs, \
-    sink_logger
+    sink_logger_instance, PrimitiveDatapoint, intern_address
 
 
 class BackendInterface(abc.ABC):
@@ -45,33 +48,30 @@ class BackendInterface(abc.ABC):
         # relationship-IOA forced as "" after initialisation if `includes_relationship` = False
         # a related datapoint is then identified by [coa, relationship-IOA]
         # if relationship-IOA != ""
-        self.coa = coa
-        self.data_store = {}
-        self.datapoints = set()
+        self.coa = intern_address(coa)
         self.callback = callback
 
         # throws away all msgs but cleans up code because there is no need to always check for
         # the existence of a logger
-        logger = sink_logger() if logger is None else logger
-        self.logger = logger
+        self.logger: Any = sink_logger_instance if logger is None else logger
 
         # for debugging
         self.__inserted_relationship = not includes_relationships
         if self.__inserted_relationship:
             self.logger.info("init data did not provide relationships - inserting empty datapoint relationships")
 
-        for dp in datapoints:
-            if not includes_relationships:
-                dp = list(dp)
-                dp.insert(4, "")
-            dp = tuple(dp)
+        if includes_relationships:
+            all_dps = [(intern_address(dp[0]), intern_address(dp[1]), dp[2], dp[3],
+                        intern_address(dp[4])) + dp[5:]
+                       for dp in map(tuple, datapoints)]
+        else:
+            all_dps = [(intern_address(dp[0]), intern_address(dp[1]), dp[2], dp[3], "") + dp[4:]
+                       for dp in map(tuple, datapoints)]
 
-            if dp[0] not in self.data_store:
-                self.data_store[dp[0]] = {dp[1]: dp}
-            else:
-                # expects unique coa-ioa combinations
-                self.data_store[dp[0]][dp[1]] = dp
-            self.datapoints.add(dp[0:5])
+        # the only store of complex datapoints, a single lookup per coa-ioa combination;
+        # expects unique coa-ioa combinations
+        self._dp_by_key = {dp[:2]: dp for dp in all_dps}
+        self._index_datapoints()
 
         if not self.sanitise_check_relationships():
             self.logger.critical("Stopping due to invalid relationship in datapoints. ")
@@ -83,7 +83,33 @@ class BackendInterface(abc.ABC):
         if autostart:
             self.wait_until_ready()
 
-    def get_IO(self, coa: COA, ioa: IOA, cot: int = 0, type_id: int = 0):
+    def _index_datapoints(self) -> None:
+        """
+        (Re)builds everything derived from the stored datapoints in a single pass.
+        Needs to be called after every change to the stored datapoints.
+        """
+        data_store: DefaultDict[COA, Dict[IOA, Tuple]] = defaultdict(dict)
+        periodic_ioas_by_coa: DefaultDict[COA, Set[IOA]] = defaultdict(set)
+        # cached primitive datapoints, avoids re-slicing the complex datapoint on every access
+        primitives = {}
+        for key, dp in self._dp_by_key.items():
+            data_store[dp[0]][dp[1]] = dp
+            primitives[key] = PrimitiveDatapoint._make(dp[:5])
+            # cot == 1 -> periodic transmission reason
+            if dp[3] == 1:
+                periodic_ioas_by_coa[dp[0]].add(dp[1])
+        self._data_store: Mapping[COA, Mapping[IOA, Tuple]] = MappingProxyType(
+            {coa: MappingProxyType(by_ioa) for coa, by_ioa in data_store.items()})
+        self._primitives: Dict[Tuple[COA, IOA], PrimitiveDatapoint] = primitives
+        self._ioas_by_coa = {coa: frozenset(by_ioa) for coa, by_ioa in data_store.items()}
+        self._periodic_ioas_by_coa = {coa: frozenset(ioas) for coa, ioas in periodic_ioas_by_coa.items()}
+
+        # lazily filled on first access
+        self._datapoints: Optional[FrozenSet[PrimitiveDatapoint]] = None
+        self._periodic_ids: Optional[FrozenSet[Tuple[COA, IOA]]] = None
+        self._periodic_dps: Optional[FrozenSet[PrimitiveDatapoint]] = None
+
+    def get_IO(self, coa: COA, ioa: IOA, cot: int = 0, type_id: int = 0) -> Any:
         """
         Retrieves the IO from an attached datapoint.
         :param coa: The COA for the requested Information Object
@@ -93,40 +119,83 @@ class BackendInterface(abc.ABC):
         :return: None if the datapoint is not attached or the type_id doesn't match the expected
             for a datapoint, otherwise query result
         """
-        if not self.has_IO(coa, ioa):
-            self.logger.warning(f"tried to get IO for unattached datapoint with ioa {ioa} and coa {coa}")
-            return None
-
-        if not self._valid_type_id(coa, ioa, type_id):
-            stored_type_id = self.get_data_point(coa, ioa)[2]
-            self.logger.warning(f"Tried sending a get-IO query with invalid command-query-ID "
-                                f"{type_id} to dp with (coa, ioa) ({coa}, {ioa})."
-                                f" Expecting type_id {stored_type_id} for command-queries to this dp."
-                                f" Not sending this query.")
+        if not self._allows_get_IO(coa, ioa, type_id):
             return None
 
         query = self._build_IO_query(coa, ioa, cot)
 
         res = self._send_query(query)
+        self._check_retrieved_IO(coa, ioa, cot, type_id, query, res)
+        return res
+
+    def get_IOs(self, ids: Iterable[Tuple[COA, IOA, int, int]]) -> Dict[Tuple[COA, IOA], Any]:
+        """
+        Retrieves the IOs from several attached datapoints, sending all queries as one batch.
+        :param ids: (coa, ioa, cot, type_id) for each requested Information Object;
+            cot and type_id are handled as for get_IO
+        :return: query result per (coa, ioa); None if the datapoint is not attached or the
+            type_id doesn't match the expected for a datapoint.
+            Only the last entry is queried if a (coa, ioa) is requested multiple times.
+        """
+        requested = {(coa, ioa): (cot, type_id) for coa, ioa, cot, type_id in ids}
+        res = dict.fromkeys(requested)
+        valid_ids = [(coa, ioa, cot, type_id) for (coa, ioa), (cot, type_id) in requested.items()
+                     if self._allows_get_IO(coa, ioa, type_id)]
+        if not valid_ids:
+            return res
+
+        queries = self._build_IO_queries_bulk([(coa, ioa, cot) for coa, ioa, cot, _ in valid_ids])
+        query_results = self._send_queries(queries)
+        if not len(valid_ids) == len(queries) == len(query_results):
+            self.logger.critical("Batched get-IO returned %s queries and %s results for %s datapoints.",
+                                 len(queries), len(query_results), len(valid_ids))
+            raise RuntimeError(f"Cannot match batched get-IO results to datapoints for RTU-Backend "
+                               f"with COA {self.coa}: expected {len(valid_ids)} queries and results.")
+        for (coa, ioa, cot, type_id), query, query_res in zip(valid_ids, queries, query_results):
+            self._check_retrieved_IO(coa, ioa, cot, type_id, query, query_res)
+            res[(coa, ioa)] = query_res
+        return res
+
+    def _allows_get_IO(self, coa: COA, ioa: IOA, type_id: int) -> bool:
+        """
+        :return: if a get-IO query with the given type_id may be sent to this datapoint;
+            logs the reason otherwise
+        """
+        dp = self._dp_by_key.get((coa, ioa))
+        if dp is None:
+            self.logger.warning("tried to get IO for unattached datapoint with ioa %s and coa %s", ioa, coa)
+            return False
+
+        if not self._valid_type_id(coa, ioa, type_id, dp):
+            self.logger.warning("Tried sending a get-IO query with invalid command-query-ID "
+                                "%s to dp with (coa, ioa) (%s, %s)."
+                                " Expecting type_id %s for command-queries to this dp."
+                                " Not sending this query.", type_id, coa, ioa, dp[2])
+            return False
+        return True
+
+    def _check_retrieved_IO(self, coa: COA, ioa: IOA, cot: int, type_id: int, query: Any,
+                            res: Any) -> None:
+        """Logs the result of a get-IO query, warning for failed queries and invalid IOs."""
         if res is None:
-            self.logger.warning(f"Retrieving IO for attached datapoint with (coa, ioa, cot) "
-                                 f"({coa}, {ioa}, {cot}) failed!")
+            self.logger.warning("Retrieving IO for attached datapoint with (coa, ioa, cot) "
+                                "(%s, %s, %s) failed!", coa, ioa, cot)
         elif type_id in type_id_to_permitted_IOs \
                 and res not in type_id_to_permitted_IOs[type_id]:
             # default type_id 0 not allowed for ASDUs -> never in type_ID_to...
 
-            self.logger.warning(f"Retrieved IO with invalid value {res} "
-                                    f"for type_id {type_id} from dp with (coa, ioa) ({coa}, {ioa})."
-                                    f"Expecting value in {type_id_to_permitted_IOs[type_id]}.")
+            self.logger.warning("Retrieved IO with invalid value %s "
+                                "for type_id %s from dp with (coa, ioa) (%s, %s)."
+                                "Expecting value in %s.",
+                                res, type_id, coa, ioa, type_id_to_permitted_IOs[type_id])
         else:
-            self.logger.debug(f"Send query {query} to datapoint with (coa, ioa, cot): "
-                              f"({coa}, {ioa}, {cot}) and result {res}")
-        return res
+            self.logger.debug("Send query %s to datapoint with (coa, ioa, cot): "
+                              "(%s, %s, %s) and result %s", query, coa, ioa, cot, res)
 
     def has_IO(self, coa: COA, ioa: IOA) -> bool:
-        return coa in self.data_store and ioa in self.data_store[coa]
+        return (coa, ioa) in self._dp_by_key
 
-    def set_IO(self, coa: COA, ioa: IOA, value, cot: int=0, type_id: int=0) -> Union[bool, None]:
+    def set_IO(self, coa: COA, ioa: IOA, value, cot: int=0, type_id: int=0) -> Any:
         """
         Overwrites IO on an attached datapoint.
         :param coa: The COA for the Information Object to be set
@@ -140,54 +209,58 @@ class BackendInterface(abc.ABC):
         Allows, but logs warning if an dp is set to a value invalid for this type_id
         """
 
-        if not self.has_IO(coa, ioa):
-            self.logger.warning(f"tried to set IO for unattached datapoint with (coa, ioa)"
-                                f" ({ioa}, {coa})")
+        dp = self._dp_by_key.get((coa, ioa))
+        if dp is None:
+            self.logger.warning("tried to set IO for unattached datapoint with (coa, ioa)"
+                                " (%s, %s)", coa, ioa)
             return None
-        stored_cot = self.get_data_point(coa, ioa)[3]
         if cot == 0:
-            cot = stored_cot
-        if not self._valid_type_id(coa, ioa, type_id):
-            stored_type_id = self.get_data_point(coa, ioa)[2]
-            self.logger.warning(f"Tried to send a set-IO query with invalid command-query-type_id "
-                                f"{type_id} to dp with (coa, ioa) ({coa}, {ioa})."
-                                f"Expecting type_id {stored_type_id} for command-queries to this dp."
-                                f"Not sending the query.")
+            cot = dp[3]
+        if not self._valid_type_id(coa, ioa, type_id, dp):
+            self.logger.warning("Tried to send a set-IO query with invalid command-query-type_id "
+                                "%s to dp with (coa, ioa) (%s, %s)."
+                                "Expecting type_id %s for command-queries to this dp."
+                                "Not sending the query.", type_id, coa, ioa, dp[2])
             # only allow queries if they have the type_id dp allows just this command
             return None
 
         if type_id in type_id_to_permitted_IOs \
                 and value not in type_id_to_permitted_IOs[type_id]:
-            self.logger.warning(f"Sending a set-IO query to with invalid value {value} "
-                                f"for type_id {type_id} to dp with (coa, ioa) ({coa}, {ioa})."
-                                f"Expecting value in {type_id_to_permitted_IOs[type_id]}.")
+            self.logger.warning("Sending a set-IO query to with invalid value %s "
+                                "for type_id %s to dp with (coa, ioa) (%s, %s)."
+                                "Expecting value in %s.",
+                                value, type_id, coa, ioa, type_id_to_permitted_IOs[type_id])
 
         query = self._build_IO_query(coa, ioa, cot, value)
         res = self._send_query(query)
 
-        self.logger.debug(f"send query {query} to datapoint with (coa, ioa, cot): "
-                           f"({coa}, {ioa}, {cot}) and result {res}")
+        self.logger.debug("send query %s to datapoint with (coa, ioa, cot): "
+                          "(%s, %s, %s) and result %s", query, coa, ioa, cot, res)
         if res is None:
-            self.logger.warning(f"setting IO for attached datapoint with (coa, ioa, cot) "
-                             f"({coa}, {ioa}, {cot}) failed!")
+            self.logger.warning("setting IO for attached datapoint with (coa, ioa, cot) "
+                                "(%s, %s, %s) failed!", coa, ioa, cot)
         return res
 
-    def set_related_IO(self, coa: COA, ioa: IOA, cot: int=0, type_id: int=0) -> Union[bool, None]:
+    def set_related_IO(self, coa: COA, ioa: IOA, cot: int=0, type_id: int=0) -> Any:
         """Sets the IO related to the coa-ioa identified datapoint."""
         if not self.has_IO(coa, ioa):
-            self.logger.warning(f"cannot set related IO from non-attached dp with (coa, ioa)"
-                                f"({coa}, {ioa})")
+            self.logger.warning("cannot set related IO from non-attached dp with (coa, ioa)"
+                                "(%s, %s)", coa, ioa)
         # relationships were sanitised before; related dp has to be attached
         related_dp = self.get_related_data_point(coa, ioa)
+        if related_dp is None:
+            return None
         return self.set_IO(related_dp[0], related_dp[1], cot, type_id)
 
-    def get_related_IO(self, coa: COA, ioa: IOA, cot: int=0, type_id: int=0) -> Union[bool, None]:
+    def get_related_IO(self, coa: COA, ioa: IOA, cot: int=0, type_id: int=0) -> Any:
         """Gets the IO related to the coa-ioa identified datapoint."""
         if not self.has_IO(coa, ioa):
-            self.logger.warning(f"cannot read related IO from non-attached dp with (coa, ioa)"
-                                f"({coa}, {ioa})")
+            self.logger.warning("cannot read related IO from non-attached dp with (coa, ioa)"
+                                "(%s, %s)", coa, ioa)
         # relationships were sanitised before; related dp has to be attached
         related_dp = self.get_related_data_point(coa, ioa)
+        if related_dp is None:
+            return None
         return self.get_IO(related_dp[0], related_dp[1], cot, type_id)
 
     def get_data_point(self, coa: COA, ioa: IOA, with_value=False) -> \
@@ -197,15 +270,13 @@ class BackendInterface(abc.ABC):
         :param with_value: if IO should be returned as well
         :return: None if datapoint is not attached, primitive datapoint alone/ with IO otherwise
         """
-        res = self._get_complex_data_point(coa, ioa, with_value)
-        if res is None:
+        dp = self._primitives.get((coa, ioa))
+        if dp is None:
             # dp not attached to RTU
             return None
-        elif len(res) == 2:
-            # with_value
-            return res[0][0:5], res[1]
-        else:
-            return res[0:5]
+        if with_value:
+            return dp, self.get_IO(coa, ioa, dp[3])
+        return dp
 
     def get_related_data_point(self, coa: COA, ioa: IOA, with_value=False) -> \
             Union[None, Tuple, Tuple[Tuple, Any]]:
@@ -214,14 +285,10 @@ class BackendInterface(abc.ABC):
         :param with_value: if IO should be returned as well
         :return: None if datapoint is not attached, primitive datapoint alone/ with IO otherwise
         """
-        res = self._get_complex_related_data_point(coa, ioa, with_value)
-        if res is None:
+        dp = self._primitives.get((coa, ioa))
+        if dp is None:
             return None
-        elif len(res) == 2:
-            # with_value
-            return res[0][0:5], res[1]
-        else:
-            return res[0:5]
+        return self.get_data_point(coa, dp[4], with_value)
 
     def _get_complex_data_point(self, coa: COA, ioa: IOA, with_value=False) -> \
             Union[None, Tuple, Tuple[Tuple, Any]]:
@@ -230,20 +297,25 @@ class BackendInterface(abc.ABC):
         :param with_value: if IO should be returned as well
         :return: None if datapoint is not attached, complex datpoint alone/ with IO otherwise
         """
-        if not self.has_IO(coa, ioa):
+        dp = self._dp_by_key.get((coa, ioa))
+        if dp is None:
             return None
-
-        dp = self.data_store[coa][ioa]
         if with_value:
             return dp, self.get_IO(coa, ioa, dp[3])
         return dp
 
     def _get_complex_related_data_point(self, coa: COA, ioa: IOA, with_value=False) -> \
             Union[None, Tuple, Tuple[Tuple, Any]]:
-        dp = self._get_complex_data_point(coa, ioa)
+        dp = self._dp_by_key.get((coa, ioa))
         if dp is None:
             return None
-        return self._get_complex_data_point(coa, dp[4], with_value)
+        # related dps share the coa
+        related_dp = self._dp_by_key.get((coa, dp[4]))
+        if related_dp is None:
+            return None
+        if with_value:
+            return related_dp, self.get_IO(coa, dp[4], related_dp[3])
+        return related_dp
 
     def get_ioas(self, coa: COA = -1) -> Set[IOA]:
         """
@@ -252,16 +324,17 @@ class BackendInterface(abc.ABC):
         Is type-sensitive as of now.    TODO: Future patch?
         """
         coa = self.coa if coa == -1 else coa
-        res = {dp[1] for dp in self.datapoints if dp[0] == coa}
-        return res
+        return set(self._ioas_by_coa.get(coa, ()))
 
     def get_periodic_ids(self) -> Set[Tuple[COA, IOA]]:
         """
         :return: all coa-ioa identifiers of all datapoints the RTU expects periodic updates from
         """
-        res = {dp[0:2] for dp in self.datapoints if dp[3] == 1}
-        # dp[3] = cot; cot == 1 -> periodic transmission reason
-        return res
+        if self._periodic_ids is None:
+            self._periodic_ids = frozenset((coa, ioa)
+                                           for coa, ioas in self._periodic_ioas_by_coa.items()
+                                           for ioa in ioas)
+        return set(self._periodic_ids)
 
     def get_periodic_ioas(self, coa: COA = -1) -> Set[IOA]:
         """
@@ -270,21 +343,23 @@ class BackendInterface(abc.ABC):
         Is type-sensitive as of now.
         """
         coa = self.coa if coa == -1 else coa
-        res = {dp[1] for dp in self.datapoints if dp[3] == 1 and dp[0] == coa}
-        return res
+        return set(self._periodic_ioas_by_coa.get(coa, ()))
 
     def get_periodic_data_points(self) -> Set[Tuple[COA, IOA, int, int, IOA]]:
         """
         :return: all primitive datapoints the RTU expects periodic updates from
         """
-        # dp[3] = cot; cot == 1 -> periodic transmission reason
-        return {dp for dp in self.datapoints if dp[3] == 1}
+        if self._periodic_dps is None:
+            self._periodic_dps = frozenset(self._primitives[(coa, ioa)]
+                                           for coa, ioas in self._periodic_ioas_by_coa.items()
+                                           for ioa in ioas)
+        return set(self._periodic_dps)
  
     def get_data_points(self) -> Set[Tuple[COA, IOA, int, int, IOA]]:
         """
         :return: all primitive datapoints attached
         """
-        return self.datapoints
+        return set(self.datapoints)
 
     def wait_until_ready(self, timeout: Union[float, None]=None) -> None:
         """
@@ -296,43 +371,43 @@ class BackendInterface(abc.ABC):
         """
         if not self.started.is_set():
             self.started.set()
-        self.logger.info(f"all clients were successfully started")
+        self.logger.info("all clients were successfully started")
 
     def change_cause_of_transmission(self, coa: COA, ioa: IOA, new_cot: int) -> None:
         """
         Change the default-cot expected for communication with a given datapoint.
         :param new_cot: int in [1,47]
         """
-        dp = self._get_complex_data_point(coa, ioa)
+        key = (coa, ioa)
+        dp = self._dp_by_key.get(key)
         if dp is None:
-            self.logger.warning(f"cannot change cot for unattached datapoint with (coa, ioa)"
-                                f"({coa}, {ioa})")
+            self.logger.warning("cannot change cot for unattached datapoint with (coa, ioa)"
+                                "(%s, %s)", coa, ioa)
             return
         elif new_cot not in range(1,48):
-            self.logger.warning(f"tried to change cot to invalid value {new_cot} for datapoint with"
-                                f"(coa, ioa) ({coa}, {ioa})")
+            self.logger.warning("tried to change cot to invalid value %s for datapoint with"
+                                "(coa, ioa) (%s, %s)", new_cot, coa, ioa)
             return
-        prim_old_dp = dp[0:5]
-        tmp = list(dp)
-        tmp[3] = new_cot
-        new_dp = tuple(tmp)
-        self.data_store[coa][ioa] = new_dp
-        self.datapoints.remove(prim_old_dp)
-        self.datapoints.add(new_dp[0:5])
+        self._dp_by_key[key] = dp[:3] + (new_cot,) + dp[4:]
+        self._index_datapoints()
 
     def sanitise_check_relationships(self) -> bool:
         """
         :return: if relationships specified match IOAs
         """
-        for dp in self.datapoints:
-            if dp[4] and not self.has_IO(dp[0], dp[4]): # relationship = IOA of datapoint with same coa
-                self.logger.critical(f"Invalid relationship for datapoint {dp}."
-                                     f"No dp with Relationship-ID {dp[4]} found!")
-                return False
+        for by_ioa in self.data_store.values():
+            for dp in by_ioa.values():
+                rel = dp[4]
+                if rel and rel not in by_ioa: # relationship = IOA of datapoint with same coa
+                    self.logger.critical("Invalid relationship for datapoint %s."
+                                         "No dp with Relationship-ID %s found!", dp[:5], rel)
+                    return False
         return True
 
-    def _valid_type_id(self, coa: COA, ioa: IOA, type_id: int) -> Union[bool, None, int]:
+    def _valid_type_id(self, coa: COA, ioa: IOA, type_id: int,
+                       dp: Optional[Tuple] = None) -> Union[bool, None, int]:
         """
+        :param dp: the datapoint identified by coa-ioa if already retrieved by the caller
         :return:
             None: dp not attached to RTU
             0: type_id handed over or stored for the dp not a command-query-type_id (45-69)
@@ -340,9 +415,10 @@ class BackendInterface(abc.ABC):
             False: type_id and stored dp-type_id unequal command-query-type_id
         if a command query with the given cot is allowed for this datapoint
         """
-        dp = self.get_data_point(coa, ioa)
         if dp is None:
-            return None
+            dp = self._dp_by_key.get((coa, ioa))
+            if dp is None:
+                return None
         if dp[2] in control_direction_processinfo_type_ids \
             and type_id in control_direction_processinfo_type_ids:
             return dp[2] == type_id
@@ -370,9 +446,39 @@ class BackendInterface(abc.ABC):
         """
         ...
 
+    def _build_IO_queries_bulk(self, ids: List[Tuple[COA, IOA, int]]) -> List[Any]:
+        """
+        Constructs the get-IO-queries for several datapoints, each identified by (coa, ioa, cot).
+        Overwrite if your model builds batched queries differently than one by one.
+        :return: one query per id, in the same order
+        """
+        return [self._build_IO_query(coa, ioa, cot) for coa, ioa, cot in ids]
+
+    def _send_queries(self, queries: List[Any]) -> List[Any]:
+        """
+        Sends several queries from _build_IO_queries_bulk at once.
+        Overwrite if your (communication-)model can transmit them together, e.g., multiple ASDUs
+            in one frame; by default, each query is sent on its own.
+        :param queries: Queries to send
+        :return: one result per query as returned by _send_query, in the same order
+        """
+        return [self._send_query(query) for query in queries]
+
+    @property
+    def data_store(self) -> Mapping[COA, Mapping[IOA, Tuple]]:
+        """Read-only view on all complex datapoints by coa and ioa"""
+        return self._data_store
+
+    @property
+    def datapoints(self) -> FrozenSet[PrimitiveDatapoint]:
+        """All primitive datapoints attached; derived from the stored datapoints on first access"""
+        if self._datapoints is None:
+            self._datapoints = frozenset(self._primitives.values())
+        return self._datapoints
+
     @property
-    def logging(self):
-        return not isinstance(self.logger, sink_logger)
+    def logging(self) -> bool:
+        return self.logger is not sink_logger_instance
 
     @staticmethod
     def from_data(*args, **kwargs):
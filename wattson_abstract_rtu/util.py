@@ -1,15 +1,24 @@
+import importlib.util
+import sys
+from collections import namedtuple
 from typing import Union
 COA = Union[int, str]
 IOA = Union[int, str]
 
+# [coa, ioa, type-ID, cot, related-ioa]; compares equal to the plain tuple
+PrimitiveDatapoint = namedtuple("PrimitiveDatapoint", "coa ioa type_id cot relationship")
+
 control_direction_processinfo_type_ids = range(45,70)
 
 def check_pkg(name):
-    from pip._internal.utils.misc import get_installed_distributions
-    pkg_names = [pkg.project_name for pkg in get_installed_distributions()]
-    return name in pkg_names
+    return importlib.util.find_spec(name) is not None
 
-FCS_installed = check_pkg("FCS")
+def __getattr__(name):
+    # FCS_installed is only checked once actually accessed
+    if name == "FCS_installed":
+        globals()[name] = check_pkg("FCS")
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # key = ASDU type ID; value = permitted IO values set to/ returned
 type_id_to_permitted_IOs  = {
@@ -23,37 +32,32 @@ type_id_to_permitted_IOs  = {
     31: (0, 1, 2, 3),
     46: (0, 1, 2, 3),
     59: (0, 1, 2, 3),
-    11: range(-32768, 3278),
-    12: range(-32768, 3278),
-    49: range(-32768, 3278),
-    62: range(-32768, 3278)
+    11: range(-32768, 32768),
+    12: range(-32768, 32768),
+    49: range(-32768, 32768),
+    62: range(-32768, 32768)
 }
 
 class sink_logger():
+    __slots__ = ()
+
     def __str__(self):
         return "This is not a real logger but only a sink"
 
-    def warning(self, msg):
+    def _discard(self, msg, *args, **kwargs):
         return
 
-    def critical(self, msg):
-        return
+    # all levels share the same no-op
+    warning = critical = info = debug = error = _discard
 
-    def info(self, msg):
-        return
+# stateless, thus shared by all backends without a logger
+sink_logger_instance = sink_logger()
 
-    def debug(self, msg):
-        return
-
-    def error(self, msg):
-        return
+def intern_address(address):
+    """Interns str-addresses (coa, ioa, relationship) so lookups can match them by identity"""
+    return sys.intern(address) if type(address) is str else address
 
 def insert_relationships(datapoints):
     """Inserts an empty relationship at index 4"""
-    new_datapoints = set()
-    for dp in datapoints:
-        cast_dp = list(dp)
-        cast_dp.insert(4, "")
-        new_datapoints.add(tuple(cast_dp))
-    return new_datapoints
+    return {dp[:4] + ("",) + dp[4:] for dp in map(tuple, datapoints)}
 